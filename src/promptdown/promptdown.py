@@ -1,14 +1,131 @@
 from __future__ import annotations
+import functools
+import io
 import logging
 import re
 from dataclasses import dataclass
-from importlib import resources
+from pathlib import Path
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
-
-@dataclass
+# Matches a "# Prompt Name" or "## Section Name" header line
+_SECTION_HEADER_RE = re.compile(
+    r"^[ \t]*(?P<level>#{1,2}) [ \t]*(?P<title>\S.*)$", re.MULTILINE
+)
+
+# Maps each lowercase "## Section" title to the kind of section it starts
+_SYSTEM_MESSAGE_SECTION = 1
+_CONVERSATION_SECTION = 2
+_SECTIONS = {
+    "system message": _SYSTEM_MESSAGE_SECTION,
+    "conversation": _CONVERSATION_SECTION,
+}
+
+# The lowercase roles that cannot be used for conversation messages
+_RESERVED_ROLES = frozenset(("system",))
+
+# The roles supported by the simplified conversation format, and their "**Role:**" indicators
+_KNOWN_ROLES = frozenset(("User", "Assistant"))
+_ROLE_INDICATORS = {f"**{role}:**": role for role in _KNOWN_ROLES}
+
+# Matches an escaped "{{" or "}}", a "{name}" template placeholder, or a str.format-style field with a
+# conversion, format spec, attribute or index (e.g., "{name:>5}"), which is not supported
+_PLACEHOLDER_RE = re.compile(
+    r"\{\{|\}\}|\{(?P<placeholder>[A-Za-z_][A-Za-z0-9_]*)\}"
+    r"|\{(?P<format_field>[A-Za-z_][A-Za-z0-9_]*)[!:.\[][^{}]*\}"
+)
+
+# Deletes every character that may appear in a table divider line (e.g., "|---|:--:|")
+_DIVIDER_TRANS = str.maketrans("", "", "|-: \t")
+
+
+def _replace_placeholders(text: str, template_values: dict[str, str]) -> str:
+    """
+    Replace the placeholders in the text with the template values, skipping triple-backtick code blocks.
+
+    Args:
+        text (str): The text containing the placeholders.
+        template_values (dict[str, str]): A dictionary mapping placeholders to their replacement values.
+
+    Returns:
+        str: The text with the placeholders replaced.
+    """
+    # Without any braces there are no placeholders or escapes, so the text is returned as is
+    if "{" not in text and "}" not in text:
+        return text
+
+    # Most texts have no code blocks, so they are formatted whole without building a list of parts
+    if "```" not in text:
+        return _format_segment(text, template_values)
+
+    parts: list[str] = []
+    position = 0
+
+    # Walk the text from one code fence to the next, formatting only the non-code segments
+    while (start := text.find("```", position)) >= 0:
+        end = text.find("```", start + 3)
+        # A fence that is never closed does not start a code block, so the rest of the text is formatted
+        if end < 0:
+            break
+        end += 3
+        parts.append(_format_segment(text[position:start], template_values))
+        parts.append(text[start:end])
+        position = end
+
+    parts.append(_format_segment(text[position:], template_values))
+    return "".join(parts)
+
+
+def _format_segment(segment: str, template_values: dict[str, str]) -> str:
+    """
+    Substitute the template values for the placeholders in a non-code segment.
+
+    Only simple {name} placeholders are replaced; placeholders without a template value, and any other
+    braces (e.g., inline JSON), are left as they are. Doubled braces ({{ and }}) produce literal braces,
+    as in str.format, but only if the segment has no other single braces; otherwise they are left as they
+    are too, so that text such as {"a": {"b": 1}} is never changed. str.format-style fields such as
+    {name:>5}, {name!r} or {name[0]} are left as they are, with a warning when a template value is given
+    for their name.
+
+    Args:
+        segment (str): A segment of text that is outside of any code block.
+        template_values (dict[str, str]): A dictionary mapping placeholders to their replacement values.
+
+    Returns:
+        str: The segment with the placeholders replaced.
+    """
+    # Without any braces there are no placeholders or escapes, so the segment is returned as is
+    if "{" not in segment and "}" not in segment:
+        return segment
+
+    # Doubled braces are only escapes where the segment is valid str.format syntax, i.e., where every
+    # brace is part of an escape or a field. Elsewhere (e.g., in nested JSON) they are literal text.
+    unescape_braces = False
+    if "{{" in segment or "}}" in segment:
+        remainder = _PLACEHOLDER_RE.sub("", segment)
+        unescape_braces = "{" not in remainder and "}" not in remainder
+
+    def replace_placeholder(match: re.Match[str]) -> str:
+        placeholder = match.group("placeholder")
+        if placeholder is None:
+            format_field = match.group("format_field")
+            # An escaped "{{" or "}}" stands for a single literal brace
+            if format_field is None:
+                return match.group(0)[0] if unescape_braces else match.group(0)
+            if format_field in template_values:
+                _LOGGER.warning(
+                    f"Template field {match.group(0)} uses str.format syntax, which is not supported. "
+                    + f"Only plain {{{format_field}}} placeholders are replaced."
+                )
+            return match.group(0)
+        value = template_values.get(placeholder)
+        return match.group(0) if value is None else str(value)
+
+    return _PLACEHOLDER_RE.sub(replace_placeholder, segment)
+
+
+@dataclass(slots=True, eq=False)
 class Message:
     role: str
     content: str
@@ -20,7 +137,7 @@ class Message:
         Raises:
             ValueError: If the role is set to "System", which is reserved.
         """
-        if self.role.lower() == "system":
+        if self.role.lower() in _RESERVED_ROLES:
             raise ValueError(
                 "The role 'System' is reserved and cannot be used for conversation messages."
             )
@@ -35,6 +152,8 @@ class Message:
         Returns:
             bool: True if both objects are Messages and have the same role, content, and name; False otherwise.
         """
+        if self is other:
+            return True
         if isinstance(other, Message):
             return (
                 self.role.lower() == other.role.lower()
@@ -44,7 +163,7 @@ class Message:
         return False
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class StructuredPrompt:
     name: str
     system_message: str
@@ -60,6 +179,8 @@ class StructuredPrompt:
         Returns:
             bool: True if both are StructuredPrompts with the same name, system_message, and conversation; False otherwise.
         """
+        if self is other:
+            return True
         if isinstance(other, StructuredPrompt):
             return (
                 self.name == other.name
@@ -84,39 +205,53 @@ class StructuredPrompt:
             list[Message]: A list of Message objects representing the parsed conversation.
         """
         conversation: list[Message] = []
-        headers: list[str] = []
-
-        for line in lines:
-            # Check if the line starts with "|", indicating a conversation row
-            if line.startswith("|"):
-                # Split the line by "|" and remove leading/trailing whitespace from each part
-                parts = [part.strip() for part in line.split("|") if part.strip()]
-
-                # If headers list is empty, it means we are parsing the first row which contains the headers
-                if not headers:
-                    headers = parts
-                else:
-                    # Skip the divider line (e.g., "|---|---|---|")
-                    if all(part == "-" * len(part) for part in parts):
-                        continue
-
-                    # Create a dictionary to store the message data
-                    message_data: dict[str, str] = {
-                        header.lower(): "" for header in headers
-                    }
-
-                    # Iterate over the headers and corresponding parts, and update the message data dictionary
-                    for header, value in zip(headers, parts):
-                        message_data[header.lower()] = value
-
-                    # Create a new Message object using the message data and append it to the conversation list
-                    conversation.append(
-                        Message(
-                            role=message_data.get("role", "user"),
-                            content=message_data.get("content", ""),
-                            name=message_data.get("name"),
-                        )
-                    )
+        columns: dict[str, int] | None = None
+        role_index: int | None = None
+        name_index: int | None = None
+        content_index: int | None = None
+        width = 0
+
+        # Only lines starting with "|" are conversation rows, and str.split cuts them into cells.
+        # Divider lines (e.g., "|---|---|---|") are dropped up front, as nothing is left once their
+        # pipes, dashes, colons and spaces are deleted.
+        rows = (
+            line.split("|")
+            for line in lines
+            if line.startswith("|") and line.translate(_DIVIDER_TRANS)
+        )
+
+        for row in rows:
+            # The first row contains the headers, so map each lowercase header to its cell position once
+            if columns is None:
+                columns = {
+                    header.strip().lower(): index
+                    for index, header in enumerate(row)
+                    if header.strip()
+                }
+                width = max(columns.values(), default=-1) + 1
+                role_index = columns.get("role")
+                name_index = columns.get("name")
+                content_index = columns.get("content")
+                continue
+
+            # Pad short rows so that missing trailing cells read as empty
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+
+            # Create a new Message object from the cells and append it to the conversation list
+            conversation.append(
+                Message(
+                    role=row[role_index].strip() if role_index is not None else "user",
+                    content=(
+                        row[content_index].strip() if content_index is not None else ""
+                    ),
+                    name=(
+                        row[name_index].strip() or None
+                        if name_index is not None
+                        else None
+                    ),
+                )
+            )
 
         # Return the parsed conversation list
         return conversation
@@ -137,7 +272,6 @@ class StructuredPrompt:
             list[Message]: A list of Message objects representing the parsed conversation.
         """
         conversation: list[Message] = []
-        known_roles = {"User", "Assistant"}
         role: str | None = None
         content: list[str] = []
 
@@ -145,37 +279,44 @@ class StructuredPrompt:
             # Strip leading/trailing whitespace from the current line
             line_strip = line.strip()
 
+            # Most role indicators are spelled exactly like "**User:**", so look the line up first
+            known_role = _ROLE_INDICATORS.get(line_strip)
+
             # If the line starts and ends with double asterisks, it's a role indicator
-            if line_strip.startswith("**") and line_strip.endswith(":**"):
+            if known_role is not None or (
+                line_strip.startswith("**") and line_strip.endswith(":**")
+            ):
                 # If a role is already set and there is accumulated content,
                 # add the message to the conversation list
                 if role and content:
                     conversation.append(
-                        Message(role=role, content=" ".join(content).strip())
+                        Message(role=role, content=" ".join(content))
                     )
                     # Clear content to start collecting the next message
                     content = []
 
-                # Extract the role name from the asterisks and colon, e.g., "**User:**"
-                role_line = line_strip.strip("*")
-                role, _, _ = role_line.partition(":")
+                if known_role is None:
+                    # Extract the role name from the asterisks and colon, e.g., "***User:**"
+                    role_line = line_strip.strip("*")
+                    role_name, _, _ = role_line.partition(":")
+
+                    # If the role is one of the known roles, use it; otherwise, warn about it
+                    if role_name in _KNOWN_ROLES:
+                        known_role = role_name
+                    else:
+                        _LOGGER.warning(
+                            f"Unknown role '{role_name}' encountered in conversation."
+                        )
 
-                # If the role is one of the known roles, update the role variable
-                if role in known_roles:
-                    role = role.strip()
-                else:
-                    _LOGGER.warning(
-                        f"Unknown role '{role}' encountered in conversation."
-                    )
-                    role = None
-            else:
-                # If it's not a role indicator, consider it part of the message content
-                content.append(line)
+                role = known_role
+            elif line_strip:
+                # If it's not a role indicator or a blank line, consider it part of the message content
+                content.append(line_strip)
 
         # If there is a role set and accumulated content after the last line,
         # append the last message to the conversation
         if role and content:
-            conversation.append(Message(role=role, content=" ".join(content).strip()))
+            conversation.append(Message(role=role, content=" ".join(content)))
 
         # Return the list of parsed messages
         return conversation
@@ -221,34 +362,46 @@ class StructuredPrompt:
             ValueError: If the promptdown string does not contain necessary sections.
         """
         name: str | None = None
-        current_section: str | None = None
         system_message: str | None = None
         system_message_lines: list[str] = []
         conversation: list[Message] | None = []
         conversation_lines: list[str] = []
 
-        lines = promptdown_string.split("\n")
-        for line in lines:
-            stripped_line = line.strip()
-
-            if stripped_line.startswith(
-                "# "
-            ):  # Found the prompt name section, e.g., "# My Prompt"
-                name = stripped_line[2:].strip()
-                current_section = None
-            elif stripped_line.startswith(
-                "## "
-            ):  # Found a section header, e.g., "## Conversation"
-                current_section = stripped_line[3:].strip().lower()
-            elif (
-                current_section == "system message"
-            ):  # We are in the system message section, so this is a line of the system message
-                if stripped_line:
-                    system_message_lines.append(stripped_line)
-            elif (
-                current_section == "conversation"
-            ):  # We are in the conversation section, so this is a line of the conversation
-                conversation_lines.append(stripped_line)
+        # Locate every header in a single regex pass, then slice the text between
+        # consecutive headers to get the body of each section
+        headers = list(_SECTION_HEADER_RE.finditer(promptdown_string))
+        for index, header in enumerate(headers):
+            title = header.group("title").strip()
+
+            if header.group("level") == "#":  # Found the prompt name, e.g., "# My Prompt"
+                name = title
+                continue
+
+            # Classify the section with a single lookup, skipping the sections that are not used
+            section = _SECTIONS.get(title.lower())
+            if section is None:
+                continue
+
+            # The body runs from the end of the header line to the start of the next header line,
+            # so its first line is the (empty) remainder of the header line itself
+            end = (
+                headers[index + 1].start()
+                if index + 1 < len(headers)
+                else len(promptdown_string)
+            )
+            # Only "\n" ends a line, as in the header regex; str.splitlines would also split on
+            # characters such as "\x0c" and "\u2028" inside the text. The "\r" of a CRLF line ending
+            # is removed when the lines are stripped below.
+            body_lines = promptdown_string[header.end():end].split("\n")[1:]
+            # A body that ends with a newline leaves an empty last element, which is not a line
+            if body_lines and not body_lines[-1]:
+                body_lines.pop()
+
+            if section == _SYSTEM_MESSAGE_SECTION:
+                # Strip every line and drop the blank ones without a Python-level loop
+                system_message_lines.extend(filter(None, map(str.strip, body_lines)))
+            else:
+                conversation_lines.extend(map(str.strip, body_lines))
 
         if name is None:
             raise ValueError(
@@ -262,7 +415,8 @@ class StructuredPrompt:
 
         system_message = "\n".join(system_message_lines)
 
-        if not conversation_lines:
+        # A Conversation section with only blank lines has no conversation, however many there are
+        if not any(conversation_lines):
             conversation = None
         else:
             conversation = cls._parse_conversation(conversation_lines)
@@ -274,6 +428,10 @@ class StructuredPrompt:
         """
         Load and parse a StructuredPrompt from a file containing promptdown-formatted text.
 
+        Parsed prompts are cached by the text of the file, so loading an unchanged file again
+        only reads it and skips parsing it. Each call still returns a fresh copy that can be
+        modified freely.
+
         Args:
             file_path (str): The file system path to the promptdown file.
 
@@ -287,14 +445,53 @@ class StructuredPrompt:
             _LOGGER.warning("Promptdown files should end with '.prompt.md'")
 
         try:
-            with open(file_path, "r") as file:
-                promptdown_string = file.read()
+            promptdown_string = Path(file_path).read_text(encoding="utf-8")
         except FileNotFoundError:
             _LOGGER.error(f"File {file_path} not found.")
             raise
 
+        return cls._parse_promptdown_string(promptdown_string)._copy()
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_promptdown_string(cls, promptdown_string: str) -> StructuredPrompt:
+        """
+        Parse promptdown-formatted text, caching the result.
+
+        The text itself is the cache key, so a file that changed on disk is parsed again no matter
+        how its modification time or size changed.
+
+        Args:
+            promptdown_string (str): The promptdown-formatted text.
+
+        Returns:
+            StructuredPrompt: The cached instance, which must not be handed out to callers.
+        """
         return cls.from_promptdown_string(promptdown_string)
 
+    @classmethod
+    def from_promptdown_files(
+        cls, file_paths: list[str], max_workers: int = 8
+    ) -> list[StructuredPrompt]:
+        """
+        Load and parse several StructuredPrompts from promptdown files, reading the files concurrently.
+
+        Args:
+            file_paths (list[str]): The file system paths to the promptdown files.
+            max_workers (int): The maximum number of files to read at the same time.
+
+        Returns:
+            list[StructuredPrompt]: New instances of StructuredPrompt, in the same order as the file paths.
+
+        Raises:
+            FileNotFoundError: If any of the specified files is not found.
+        """
+        # Imported here so that only callers loading files in batches pay for the import
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.from_promptdown_file, file_paths))
+
     @classmethod
     def from_package_resource(
         cls, package: str, resource_name: str
@@ -302,6 +499,10 @@ class StructuredPrompt:
         """
         Load and parse a StructuredPrompt from a resource within a package.
 
+        Resources share the cache used by from_promptdown_file, which is keyed by the text, so
+        loading an unchanged resource again skips parsing it. Each call still returns a fresh copy
+        that can be modified freely.
+
         Args:
             package (str): The name of the package containing the resource.
             resource_name (str): The name of the resource file to load.
@@ -315,15 +516,69 @@ class StructuredPrompt:
         if not resource_name.endswith(".prompt.md"):
             _LOGGER.warning("Promptdown files should end with '.prompt.md'")
 
+        # Imported here so that only callers loading package resources pay for the import
+        from importlib import resources
+
         try:
             resource_path = resources.files(package) / resource_name
-            with resource_path.open("r", encoding="utf-8") as file:
-                promptdown_string = file.read()
+            promptdown_string = resource_path.read_text(encoding="utf-8")
         except FileNotFoundError:
             _LOGGER.error(f"File {resource_name} not found in package {package}.")
             raise
 
-        return cls.from_promptdown_string(promptdown_string)
+        return cls._parse_promptdown_string(promptdown_string)._copy()
+
+    @classmethod
+    def from_package_resources(
+        cls, package: str, resource_names: list[str], max_workers: int = 8
+    ) -> list[StructuredPrompt]:
+        """
+        Load and parse several StructuredPrompts from resources within a package, reading the resources concurrently.
+
+        Args:
+            package (str): The name of the package containing the resources.
+            resource_names (list[str]): The names of the resource files to load.
+            max_workers (int): The maximum number of resources to read at the same time.
+
+        Returns:
+            list[StructuredPrompt]: New instances of StructuredPrompt, in the same order as the resource names.
+
+        Raises:
+            FileNotFoundError: If any of the resources is not found within the specified package.
+        """
+        # Imported here so that only callers loading resources in batches pay for the import
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda resource_name: cls.from_package_resource(
+                        package, resource_name
+                    ),
+                    resource_names,
+                )
+            )
+
+    def _copy(self) -> StructuredPrompt:
+        """
+        Create a copy of the StructuredPrompt with its own conversation list and Message objects.
+
+        Returns:
+            StructuredPrompt: A copy that can be modified without affecting this instance.
+        """
+        conversation = (
+            None
+            if self.conversation is None
+            else [
+                Message(role=message.role, content=message.content, name=message.name)
+                for message in self.conversation
+            ]
+        )
+        return type(self)(
+            name=self.name,
+            system_message=self.system_message,
+            conversation=conversation,
+        )
 
     def to_promptdown_string(self) -> str:
         """
@@ -332,44 +587,39 @@ class StructuredPrompt:
         Returns:
             str: The serialized promptdown-formatted string of the StructuredPrompt.
         """
-        lines: list[str] = []
+        buffer = io.StringIO()
+        write = buffer.write
 
-        # Add the name of the prompt
-        lines.append(f"# {self.name}")
-        lines.append("")
-
-        # Add the system message
-        lines.append("## System Message")
-        lines.append(self.system_message)
-        lines.append("")
+        # Add the name of the prompt and the system message
+        write(f"# {self.name}\n\n## System Message\n{self.system_message}\n\n")
 
         if self.conversation is not None:
             # Add the conversation
-            lines.append("## Conversation")
-            lines.append("")
-
-            # Check if any message has a name set
-            include_name_column = any(message.name for message in self.conversation)
-
-            # Add the table headers
-            headers = ["Role"]
+            write("## Conversation\n\n")
+
+            # Touch each message once, packing its cells into a tuple, then check if any has a name set
+            rows = [
+                (
+                    message.role,
+                    message.name if message.name is not None else "",
+                    message.content,
+                )
+                for message in self.conversation
+            ]
+            include_name_column = any(name for _, name, _ in rows)
+
+            # Add the table headers and pick the row template once for the whole table
             if include_name_column:
-                headers.append("Name")
-            headers.append("Content")
-            lines.append(f"| {' | '.join(headers)} |")
-            lines.append(f"| {' | '.join(['---'] * len(headers))} |")
-
-            # Add each message in the conversation
-            for message in self.conversation:
-                role = message.role
-                content = message.content
-                if include_name_column:
-                    name = message.name if message.name is not None else ""
-                    lines.append(f"| {role} | {name} | {content} |")
-                else:
-                    lines.append(f"| {role} | {content} |")
+                write("| Role | Name | Content |\n| --- | --- | --- |\n")
+                for row in rows:
+                    write("| %s | %s | %s |\n" % row)
+            else:
+                write("| Role | Content |\n| --- | --- |\n")
+                for role, _, content in rows:
+                    write("| %s | %s |\n" % (role, content))
 
-        return "\n".join(lines)
+        # Every line was written with a terminating newline, but the last one is not part of the format
+        return buffer.getvalue()[:-1]
 
     def to_promptdown_file(self, file_path: str) -> None:
         """
@@ -386,11 +636,16 @@ class StructuredPrompt:
             file.write(self.to_promptdown_string())
 
     def to_chat_completion_messages(
-        self,
+        self, content_parts: bool = True
     ) -> list[dict[str, str | list[dict[str, Any]]]]:
         """
         Convert the StructuredPrompt's conversation into the structure needed for a chat completion API client.
 
+        Args:
+            content_parts (bool): Whether to wrap each conversation message's content in a list of typed
+                content parts (e.g., [{"type": "text", "text": "..."}]). Set to False to use the plain
+                string content that text-only clients accept, which is smaller to build and to send.
+
         Returns:
             list[dict[str, str | list[dict[str, Any]]]]: A list of message dictionaries suitable for a chat completion API client.
         """
@@ -402,13 +657,18 @@ class StructuredPrompt:
         # Add the conversation messages
         if self.conversation is not None:
             for message in self.conversation:
-                content: list[dict[str, Any]] = [
-                    {"type": "text", "text": message.content}
-                ]
-                msg: dict[str, Any] = {"role": message.role.lower(), "content": content}
-                if message.name:
-                    msg["name"] = message.name
-                messages.append(msg)
+                role = message.role.lower()
+                content: str | list[dict[str, Any]] = (
+                    [{"type": "text", "text": message.content}]
+                    if content_parts
+                    else message.content
+                )
+                # Build each message dict in one go rather than inserting the name afterwards
+                messages.append(
+                    {"role": role, "content": content, "name": message.name}
+                    if message.name
+                    else {"role": role, "content": content}
+                )
 
         return messages
 
@@ -416,25 +676,82 @@ class StructuredPrompt:
         """
         Apply template values to the placeholders in the prompt content, replacing them with the specified values.
         NOTE: Template values are not applied if the placeholder is within a triple-backtick code block,
-        as this is likely a JSON example.
+        as this is likely a JSON example. Placeholders without a template value are left as they are.
 
         Args:
             template_values (dict[str, str]): A dictionary mapping placeholders to their replacement values.
         """
-
-        def replace_placeholders(text: str) -> str:
-            # Split the text into code and non-code segments
-            segments = re.split(r"(```.*?```)", text, flags=re.DOTALL)
-            # Process only the non-code segments
-            for i, segment in enumerate(segments):
-                if not segment.startswith("```"):
-                    segments[i] = segment.format(**template_values)
-            return "".join(segments)
-
         # Replace placeholders in the system message
-        self.system_message = replace_placeholders(self.system_message)
+        self.system_message = _replace_placeholders(
+            self.system_message, template_values
+        )
 
         # Replace placeholders in each message in the conversation
         if self.conversation is not None:
             for message in self.conversation:
-                message.content = replace_placeholders(message.content)
+                message.content = _replace_placeholders(
+                    message.content, template_values
+                )
+
+    @classmethod
+    def apply_template_values_batch(
+        cls, prompts: list[StructuredPrompt], template_values: dict[str, str]
+    ) -> None:
+        """
+        Apply the same template values to several prompts in place, as apply_template_values does for one.
+
+        Prompts created from the same template share most of their text (e.g., the system message), so
+        each distinct text is templated only once and the result is reused for the other prompts.
+
+        Args:
+            prompts (list[StructuredPrompt]): The prompts to apply the template values to.
+            template_values (dict[str, str]): A dictionary mapping placeholders to their replacement values.
+        """
+        replaced_texts: dict[str, str] = {}
+
+        def replace_placeholders(text: str) -> str:
+            replaced_text = replaced_texts.get(text)
+            if replaced_text is None:
+                replaced_text = replaced_texts[text] = _replace_placeholders(
+                    text, template_values
+                )
+            return replaced_text
+
+        for prompt in prompts:
+            # Replace placeholders in the system message
+            prompt.system_message = replace_placeholders(prompt.system_message)
+
+            # Replace placeholders in each message in the conversation
+            if prompt.conversation is not None:
+                for message in prompt.conversation:
+                    message.content = replace_placeholders(message.content)
+
+    def render(self, template_values: dict[str, str]) -> StructuredPrompt:
+        """
+        Create a new StructuredPrompt with template values applied to the placeholders, leaving this
+        instance unchanged so that it can be kept (or cached) as a template and rendered again.
+        NOTE: As with apply_template_values, placeholders within triple-backtick code blocks are not replaced.
+
+        Args:
+            template_values (dict[str, str]): A dictionary mapping placeholders to their replacement values.
+
+        Returns:
+            StructuredPrompt: A new instance of StructuredPrompt with the template values applied.
+        """
+        conversation = (
+            None
+            if self.conversation is None
+            else [
+                Message(
+                    role=message.role,
+                    content=_replace_placeholders(message.content, template_values),
+                    name=message.name,
+                )
+                for message in self.conversation
+            ]
+        )
+        return type(self)(
+            name=self.name,
+            system_message=_replace_placeholders(self.system_message, template_values),
+            conversation=conversation,
+        )
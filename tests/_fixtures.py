@@ -0,0 +1,37 @@
+from promptdown import Message
+
+
+# The (role, content, name) of each message in the example conversation, without names
+EXAMPLE_CONVERSATION: tuple[tuple[str, str, str | None], ...] = (
+    ("User", "Hi, can you help me?", None),
+    ("Assistant", "Of course! What do you need assistance with?", None),
+    ("User", "I'm having trouble with my code.", None),
+    ("Assistant", "I'd be happy to help. What seems to be the problem?", None),
+    ("User", 'I\'m getting an error message that says "undefined variable".', None),
+    (
+        "Assistant",
+        "That error usually occurs when you try to use a variable that hasn't been declared or "
+        + "assigned a value. Can you show me the code where you're encountering this error?",
+        None,
+    ),
+)
+
+# The (role, content, name) of each message in the example conversation, with names
+EXAMPLE_CONVERSATION_WITH_NAMES: tuple[tuple[str, str, str | None], ...] = (
+    ("User", "Hi, can you help me?", "Alice"),
+    ("Assistant", "Of course! What do you need assistance with?", "Bot"),
+    ("User", "I'm having trouble with my code.", "Alice"),
+    ("Assistant", "I'd be happy to help. What seems to be the problem?", "Bot"),
+    ("User", 'I\'m getting an error message that says "undefined variable".', "Alice"),
+    (
+        "Assistant",
+        "That error usually occurs when you try to use a variable that hasn't been declared or "
+        + "assigned a value. Can you show me the code where you're encountering this error?",
+        "Bot",
+    ),
+)
+
+
+def build_conversation(rows: tuple[tuple[str, str, str | None], ...]) -> list[Message]:
+    """Build new Message objects from the rows, so that tests can modify them without affecting each other."""
+    return [Message(role=role, content=content, name=name) for role, content, name in rows]
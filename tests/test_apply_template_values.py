@@ -1,3 +1,4 @@
+import logging
 from promptdown import StructuredPrompt, Message
 
 
@@ -90,3 +91,144 @@ This would be the user message
 
     # Action: Apply the template values
     structured_prompt.apply_template_values(template_values)
+
+
+def test_render_leaves_template_unchanged():
+
+    # Create a structured prompt with placeholders
+    template = StructuredPrompt(
+        name="Test Prompt",
+        system_message="You are a helpful expert at {topic}.",
+        conversation=[
+            Message(role="User", content="What is the capital of {country}?"),
+        ],
+    )
+
+    # Action: Render the template with two different sets of values
+    france_prompt = template.render({"country": "France", "topic": "geography"})
+    japan_prompt = template.render({"country": "Japan", "topic": "geography"})
+
+    # Assertions to check that each rendering is independent and the template is untouched
+    assert france_prompt.system_message == "You are a helpful expert at geography."
+    if conversation := france_prompt.conversation:
+        assert conversation[0].content == "What is the capital of France?"
+    if conversation := japan_prompt.conversation:
+        assert conversation[0].content == "What is the capital of Japan?"
+    assert template.system_message == "You are a helpful expert at {topic}."
+    if conversation := template.conversation:
+        assert conversation[0].content == "What is the capital of {country}?"
+
+
+def test_unclosed_code_block_is_formatted():
+
+    # Create a structured prompt whose code block is never closed
+    structured_prompt = StructuredPrompt(
+        name="Test Prompt",
+        system_message='Answer questions about {topic} like this:\n```json\n{"answer": "{topic}"}',
+    )
+
+    # Action: Apply the template values
+    structured_prompt.apply_template_values({"topic": "geography"})
+
+    # Assertions to check that the text after the unclosed fence is formatted too
+    assert (
+        structured_prompt.system_message
+        == 'Answer questions about geography like this:\n```json\n{"answer": "geography"}'
+    )
+
+
+def test_unknown_placeholders_and_braces_are_left_untouched():
+
+    # Create a structured prompt with an unknown placeholder, inline JSON and escaped braces
+    structured_prompt = StructuredPrompt(
+        name="Test Prompt",
+        system_message='You are a helpful expert at {topic} and {unknown}. Reply like {"answer": 42} or {{topic}}.',
+    )
+
+    # Action: Apply the template values
+    structured_prompt.apply_template_values({"topic": "geography"})
+
+    # Assertions to check that only the known placeholder is replaced, and that doubled braces next to
+    # other braces are not treated as escapes
+    assert (
+        structured_prompt.system_message
+        == 'You are a helpful expert at geography and {unknown}. Reply like {"answer": 42} or {{topic}}.'
+    )
+
+
+def test_nested_json_is_left_untouched():
+
+    # Create a structured prompt with nested JSON, whose closing braces are doubled
+    structured_prompt = StructuredPrompt(
+        name="Test Prompt",
+        system_message='Reply like {"answer": {"value": 42}}.',
+    )
+
+    # Action: Apply no template values
+    structured_prompt.apply_template_values({})
+
+    # Assertions to check that the JSON is left as it is
+    assert structured_prompt.system_message == 'Reply like {"answer": {"value": 42}}.'
+
+
+def test_escaped_braces_are_unescaped():
+
+    # Create a structured prompt that escapes its braces as str.format requires
+    structured_prompt = StructuredPrompt(
+        name="Test Prompt",
+        system_message='Reply like {{"answer": "{topic}"}}.',
+    )
+
+    # Action: Apply the template values
+    structured_prompt.apply_template_values({"topic": "geography"})
+
+    # Assertions to check that the doubled braces produce literal braces
+    assert structured_prompt.system_message == 'Reply like {"answer": "geography"}.'
+
+
+def test_format_fields_are_left_untouched_with_a_warning(caplog):
+
+    # Create a structured prompt with str.format-style fields, which are not supported
+    structured_prompt = StructuredPrompt(
+        name="Test Prompt",
+        system_message="You are a helpful expert at {topic:>12}, {topic!r} and {topic[0]}, not {other:>5}.",
+    )
+
+    # Action: Apply the template values
+    with caplog.at_level(logging.WARNING, logger="promptdown"):
+        structured_prompt.apply_template_values({"topic": "geography"})
+
+    # Assertions to check that the fields are left as they are, with a warning for each one that has a value
+    assert (
+        structured_prompt.system_message
+        == "You are a helpful expert at {topic:>12}, {topic!r} and {topic[0]}, not {other:>5}."
+    )
+    assert [record.levelno for record in caplog.records] == [logging.WARNING] * 3
+    assert "{topic:>12} uses str.format syntax" in caplog.text
+    assert "{other:>5}" not in caplog.text
+
+
+def test_apply_template_values_batch():
+
+    # Create structured prompts that share a system message but have their own conversations
+    prompts = [
+        StructuredPrompt(
+            name="Test Prompt",
+            system_message="You are a helpful expert at {topic}.",
+            conversation=[Message(role="User", content=f"What is the capital of {country}?")],
+        )
+        for country in ("France", "{country}")
+    ]
+
+    # Action: Apply the template values to all of the prompts at once
+    StructuredPrompt.apply_template_values_batch(
+        prompts, {"topic": "geography", "country": "Japan"}
+    )
+
+    # Assertions to check that every prompt was updated
+    for prompt in prompts:
+        assert prompt.system_message == "You are a helpful expert at geography."
+    if conversation := prompts[0].conversation:
+        assert conversation[0].content == "What is the capital of France?"
+    if conversation := prompts[1].conversation:
+        assert conversation[0].content == "What is the capital of Japan?"
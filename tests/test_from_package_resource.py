@@ -1,50 +1,72 @@
 import pytest
 from importlib import resources
-from promptdown import StructuredPrompt, Message
+from promptdown import StructuredPrompt
+from tests._fixtures import EXAMPLE_CONVERSATION, build_conversation
 
 
-def test_from_package_resource_success():
-    """Test successful loading of a structured prompt from a package resource."""
+_RESOURCE = resources.files("tests") / "test.prompt.md"
 
-    expected_prompt = StructuredPrompt(
-        name="Example Prompt",
-        system_message="You are a helpful assistant.",
-        conversation=[
-            Message(role="User", content="Hi, can you help me?"),
-            Message(
-                role="Assistant", content="Of course! What do you need assistance with?"
-            ),
-            Message(role="User", content="I'm having trouble with my code."),
-            Message(
-                role="Assistant",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                content="That error usually occurs when you try to use a variable that hasn't been declared or "
-                + "assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
-    )
+EXPECTED_PROMPT = StructuredPrompt(
+    name="Example Prompt",
+    system_message="You are a helpful assistant.",
+    conversation=build_conversation(EXAMPLE_CONVERSATION),
+)
+
+
+@pytest.fixture(scope="session")
+def packaged_prompt_text():
+    """Read the packaged test prompt once per session."""
+    return _RESOURCE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def packaged_prompt(packaged_prompt_text):
+    """Parse the packaged test prompt once per session."""
+    return StructuredPrompt.from_promptdown_string(packaged_prompt_text)
+
+
+def test_from_package_resource_success(packaged_prompt):
+    """Test successful loading of a structured prompt from a package resource."""
+    assert packaged_prompt is not None
+    assert isinstance(packaged_prompt, StructuredPrompt)
+    assert packaged_prompt.name == EXPECTED_PROMPT.name
+    assert packaged_prompt.system_message == EXPECTED_PROMPT.system_message
+    assert packaged_prompt.conversation == EXPECTED_PROMPT.conversation
 
-    resource_path = resources.files("tests") / "test.prompt.md"
-    with resource_path.open("r", encoding="utf-8") as file:
-        promptdown_string = file.read()
 
-        prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
+def test_from_package_resource_returns_independent_copies():
+    """Test that repeated loads of a cached resource do not share mutable state."""
+    first_prompt = StructuredPrompt.from_package_resource("tests", "test.prompt.md")
+    if conversation := first_prompt.conversation:
+        conversation[0].content = "Changed"
 
-        assert prompt is not None
-        assert isinstance(prompt, StructuredPrompt)
-        assert prompt.name == expected_prompt.name
-        assert prompt.system_message == expected_prompt.system_message
-        assert prompt.conversation == expected_prompt.conversation
+    second_prompt = StructuredPrompt.from_package_resource("tests", "test.prompt.md")
+    assert second_prompt is not first_prompt
+    assert second_prompt == EXPECTED_PROMPT
 
 
+@pytest.mark.filterwarnings("error::ResourceWarning")
 def test_from_package_resource_failure():
     """Test handling of non-existent file to ensure proper error management."""
     with pytest.raises(FileNotFoundError):
         StructuredPrompt.from_package_resource("tests", "non_existent.prompt.md")
+
+
+def test_from_package_resources_success():
+    """Test loading several structured prompts from package resources at once."""
+    prompts = StructuredPrompt.from_package_resources(
+        "tests", ["test.prompt.md", "test.prompt.md"]
+    )
+
+    assert len(prompts) == 2
+    assert prompts[0] == prompts[1]
+    assert prompts[0] is not prompts[1]
+    assert prompts[0].name == "Example Prompt"
+
+
+def test_from_package_resources_failure():
+    """Test that a missing resource in a batch raises like a single load does."""
+    with pytest.raises(FileNotFoundError):
+        StructuredPrompt.from_package_resources(
+            "tests", ["test.prompt.md", "non_existent.prompt.md"]
+        )
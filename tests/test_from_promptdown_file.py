@@ -0,0 +1,70 @@
+import pytest
+from promptdown import StructuredPrompt
+
+
+def test_from_promptdown_file_returns_independent_copies(tmp_path):
+    """Test that repeated loads of a cached file do not share mutable state."""
+    file_path = tmp_path / "example.prompt.md"
+    file_path.write_text(
+        """# Example Prompt
+
+## System Message
+
+You are a helpful expert at {topic}.
+
+## Conversation
+
+| Role | Content |
+|---|---|
+| User | What is the capital of {country}? |
+""",
+        encoding="utf-8",
+    )
+
+    first_prompt = StructuredPrompt.from_promptdown_file(str(file_path))
+    first_prompt.apply_template_values({"topic": "geography", "country": "France"})
+
+    second_prompt = StructuredPrompt.from_promptdown_file(str(file_path))
+    assert second_prompt is not first_prompt
+    assert second_prompt.system_message == "You are a helpful expert at {topic}."
+    if conversation := second_prompt.conversation:
+        assert conversation[0].content == "What is the capital of {country}?"
+
+
+def test_from_promptdown_file_reloads_changed_file(tmp_path):
+    """Test that a file modified on disk is parsed again instead of served from the cache."""
+    file_path = tmp_path / "example.prompt.md"
+    file_path.write_text(
+        "# First Prompt\n\n## System Message\n\nYou are a helpful assistant.\n",
+        encoding="utf-8",
+    )
+    assert StructuredPrompt.from_promptdown_file(str(file_path)).name == "First Prompt"
+
+    # Same size as before, so only the contents tell the two versions apart
+    file_path.write_text(
+        "# Other Prompt\n\n## System Message\n\nYou are a helpful assistant.\n",
+        encoding="utf-8",
+    )
+    assert StructuredPrompt.from_promptdown_file(str(file_path)).name == "Other Prompt"
+
+
+def test_from_promptdown_file_failure(tmp_path):
+    """Test handling of non-existent file to ensure proper error management."""
+    with pytest.raises(FileNotFoundError):
+        StructuredPrompt.from_promptdown_file(str(tmp_path / "non_existent.prompt.md"))
+
+
+def test_from_promptdown_files_preserves_order(tmp_path):
+    """Test that loading several files at once returns the prompts in the order of the paths."""
+    file_paths = []
+    for index in range(5):
+        file_path = tmp_path / f"example_{index}.prompt.md"
+        file_path.write_text(
+            f"# Prompt {index}\n\n## System Message\n\nYou are assistant number {index}.\n",
+            encoding="utf-8",
+        )
+        file_paths.append(str(file_path))
+
+    prompts = StructuredPrompt.from_promptdown_files(file_paths, max_workers=2)
+
+    assert [prompt.name for prompt in prompts] == [f"Prompt {index}" for index in range(5)]
@@ -1,8 +1,11 @@
+import pytest
 from promptdown import StructuredPrompt, Message
+from tests._fixtures import EXAMPLE_CONVERSATION, EXAMPLE_CONVERSATION_WITH_NAMES, build_conversation
 
 
-def test_from_promptdown_string_without_names():
-    promptdown_string = """
+CASES = [
+    pytest.param(
+        """
 # Example Prompt
 
 ## System Message
@@ -21,43 +24,16 @@ You should try to provide clear and concise answers to the user's questions.
 | Assistant | I'd be happy to help. What seems to be the problem? |
 | User    | I'm getting an error message that says "undefined variable". |
 | Assistant | That error usually occurs when you try to use a variable that hasn't been declared or assigned a value. Can you show me the code where you're encountering this error? |
-"""  # noqa: E501
-
-    expected_prompt = StructuredPrompt(
-        name="Example Prompt",
-        system_message="You are a helpful assistant.\nYou should try to provide clear and concise answers to the user's questions.",
-        conversation=[
-            Message(role="User", content="Hi, can you help me?"),
-            Message(
-                role="Assistant", content="Of course! What do you need assistance with?"
-            ),
-            Message(role="User", content="I'm having trouble with my code."),
-            Message(
-                role="Assistant",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                content="That error usually occurs when you try to use a variable that hasn't been declared or "
-                + "assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
-    )
-
-    prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
-    assert prompt is not None
-    assert isinstance(prompt, StructuredPrompt)
-    assert prompt.name == expected_prompt.name
-    assert prompt.system_message == expected_prompt.system_message
-    assert prompt.conversation == expected_prompt.conversation
-
-
-def test_from_promptdown_string_with_names():
-    promptdown_string = """
+""",  # noqa: E501
+        StructuredPrompt(
+            name="Example Prompt",
+            system_message="You are a helpful assistant.\nYou should try to provide clear and concise answers to the user's questions.",
+            conversation=build_conversation(EXAMPLE_CONVERSATION),
+        ),
+        id="without-names",
+    ),
+    pytest.param(
+        """
 # Example Prompt
 
 ## System Message
@@ -74,45 +50,16 @@ You are a helpful assistant.
 | Assistant  | Bot       | I'd be happy to help. What seems to be the problem?  |
 | User       | Alice     | I'm getting an error message that says "undefined variable". |
 | Assistant  | Bot       | That error usually occurs when you try to use a variable that hasn't been declared or assigned a value. Can you show me the code where you're encountering this error? |
-"""
-
-    expected_prompt = StructuredPrompt(
-        name="Example Prompt",
-        system_message="You are a helpful assistant.",
-        conversation=[
-            Message(role="User", name="Alice", content="Hi, can you help me?"),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="Of course! What do you need assistance with?",
-            ),
-            Message(
-                role="User", name="Alice", content="I'm having trouble with my code."
-            ),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                name="Alice",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="That error usually occurs when you try to use a variable that hasn't been declared or assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
-    )
-
-    prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
-    assert prompt == expected_prompt
-
-
-def test_from_promptdown_string_with_simplified_conversation_format():
-    promptdown_string = """
+""",
+        StructuredPrompt(
+            name="Example Prompt",
+            system_message="You are a helpful assistant.",
+            conversation=build_conversation(EXAMPLE_CONVERSATION_WITH_NAMES),
+        ),
+        id="with-names",
+    ),
+    pytest.param(
+        """
 # Test Prompt
 
 ## System Message
@@ -134,25 +81,174 @@ Could you help me with my project?
 
 **Assistant:**
 Absolutely! What do you need help with?
-"""
+""",
+        StructuredPrompt(
+            name="Test Prompt",
+            system_message="This is a test system message.\nThis is a second line of the system message.",
+            conversation=[
+                Message(role="User", content="Hello, how are you?"),
+                Message(
+                    role="Assistant",
+                    content="I'm good, thank you! How can I assist you today?",
+                ),
+                Message(role="User", content="Could you help me with my project?"),
+                Message(
+                    role="Assistant", content="Absolutely! What do you need help with?"
+                ),
+            ],
+        ),
+        id="with-simplified-conversation-format",
+    ),
+    pytest.param(
+        """
+# Example Prompt
 
-    expected_prompt = StructuredPrompt(
-        name="Test Prompt",
-        system_message="This is a test system message.\nThis is a second line of the system message.",
-        conversation=[
-            Message(role="User", content="Hello, how are you?"),
-            Message(
-                role="Assistant",
-                content="I'm good, thank you! How can I assist you today?",
-            ),
-            Message(role="User", content="Could you help me with my project?"),
-            Message(
-                role="Assistant", content="Absolutely! What do you need help with?"
-            ),
-        ],
-    )
+## System Message
+
+You are a helpful assistant.
+
+## Conversation
+
+| Role      | Name  | Content                                      |
+|-----------|-------|----------------------------------------------|
+| User      | Alice | Hi, can you help me?                         |
+| Assistant |       | Of course! What do you need assistance with? |
+""",
+        StructuredPrompt(
+            name="Example Prompt",
+            system_message="You are a helpful assistant.",
+            conversation=[
+                Message(role="User", name="Alice", content="Hi, can you help me?"),
+                Message(
+                    role="Assistant", content="Of course! What do you need assistance with?"
+                ),
+            ],
+        ),
+        id="with-empty-name-cell",
+    ),
+    pytest.param(
+        """
+# Example Prompt
+
+## System Message
+
+You are a helpful assistant.
+
+## Conversation
+
+| Role      | Content              |
+|:----------|:--------------------:|
+| User      | Hi, can you help me? |
+""",
+        StructuredPrompt(
+            name="Example Prompt",
+            system_message="You are a helpful assistant.",
+            conversation=[Message(role="User", content="Hi, can you help me?")],
+        ),
+        id="with-aligned-divider",
+    ),
+    pytest.param(
+        """
+# Test Prompt
 
-    actual_prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
+## System Message
+
+This is a test system message.
+
+## Conversation
+
+**User:**
+
+Hello, how are you?
+
+Could you help me with my project?
+
+**Assistant:**
+
+""",
+        StructuredPrompt(
+            name="Test Prompt",
+            system_message="This is a test system message.",
+            conversation=[
+                Message(
+                    role="User",
+                    content="Hello, how are you? Could you help me with my project?",
+                ),
+            ],
+        ),
+        id="simplified-format-skips-blank-lines",
+    ),
+    pytest.param(
+        "# Example Prompt\r\n"
+        "\r\n"
+        "## System Message\r\n"
+        "\r\n"
+        "You are a helpful\x85assistant.\r\n"
+        "\r\n"
+        "## Conversation\r\n"
+        "\r\n"
+        "| Role | Content |\r\n"
+        "|------|---------|\r\n"
+        "| User | first\u2028second |\r\n",
+        StructuredPrompt(
+            name="Example Prompt",
+            system_message="You are a helpful\x85assistant.",
+            conversation=[Message(role="User", content="first\u2028second")],
+        ),
+        id="with-crlf-and-unicode-line-separators",
+    ),
+]
+
+
+@pytest.fixture(
+    scope="module",
+    params=[case.values for case in CASES],
+    ids=[case.id for case in CASES],
+)
+def parsed_case(request):
+    """Parse each case's promptdown string once, for all of the tests that check it."""
+    promptdown_string, expected_prompt = request.param
+    return StructuredPrompt.from_promptdown_string(promptdown_string), expected_prompt
+
+
+def test_from_promptdown_string(parsed_case):
+    prompt, expected_prompt = parsed_case
+    assert prompt is not None
+    assert isinstance(prompt, StructuredPrompt)
+    assert prompt.name == expected_prompt.name
+    assert prompt.system_message == expected_prompt.system_message
+    assert prompt.conversation == expected_prompt.conversation
+    assert prompt == expected_prompt
+
+
+def test_from_promptdown_string_round_trip(parsed_case):
+    prompt, expected_prompt = parsed_case
     assert (
-        actual_prompt == expected_prompt
-    ), "Failed to parse simplified conversation format correctly."
+        StructuredPrompt.from_promptdown_string(prompt.to_promptdown_string())
+        == expected_prompt
+    )
+
+
+def test_from_promptdown_string_with_large_table_cell():
+    """Test that table cells are not limited in size and may contain any character."""
+    large_content = "x" * 200_000
+    promptdown_string = f"""
+# Example Prompt
+
+## System Message
+
+You are a helpful assistant.
+
+## Conversation
+
+| Role      | Content |
+|-----------|---------|
+| User      | {large_content} |
+| Assistant | Before\0after |
+"""
+
+    prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
+    assert prompt.conversation == [
+        Message(role="User", content=large_content),
+        Message(role="Assistant", content="Before\0after"),
+    ]
@@ -1,30 +1,26 @@
+import pytest
 from promptdown import StructuredPrompt
 
 
-def test_only_single_line_system_message_from_promptdown_string():
-    promptdown_string = """
+@pytest.mark.parametrize(
+    "promptdown_string,expected_prompt",
+    [
+        pytest.param(
+            """
 # Example Prompt
 
 ## System Message
 
 You are a helpful assistant. You are an expert in Python programming.
-"""
-
-    expected_prompt = StructuredPrompt(
-        name="Example Prompt",
-        system_message="You are a helpful assistant. You are an expert in Python programming.",
-    )
-
-    prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
-    assert prompt is not None
-    assert isinstance(prompt, StructuredPrompt)
-    assert prompt.name == expected_prompt.name
-    assert prompt.system_message == expected_prompt.system_message
-    assert prompt.conversation == expected_prompt.conversation
-
-
-def test_only_multi_line_system_message_from_promptdown_string():
-    promptdown_string = """
+""",
+            StructuredPrompt(
+                name="Example Prompt",
+                system_message="You are a helpful assistant. You are an expert in Python programming.",
+            ),
+            id="single-line",
+        ),
+        pytest.param(
+            """
 # Example Prompt
 
 ## System Message
@@ -32,13 +28,16 @@ def test_only_multi_line_system_message_from_promptdown_string():
 You are a helpful assistant. You are an expert in Python programming.
 
 When you are answering a question, you should try focus on using best practices and good coding style.
-"""
-
-    expected_prompt = StructuredPrompt(
-        name="Example Prompt",
-        system_message="You are a helpful assistant. You are an expert in Python programming.\nWhen you are answering a question, you should try focus on using best practices and good coding style.",
-    )
-
+""",
+            StructuredPrompt(
+                name="Example Prompt",
+                system_message="You are a helpful assistant. You are an expert in Python programming.\nWhen you are answering a question, you should try focus on using best practices and good coding style.",
+            ),
+            id="multi-line",
+        ),
+    ],
+)
+def test_only_system_message_from_promptdown_string(promptdown_string, expected_prompt):
     prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
     assert prompt is not None
     assert isinstance(prompt, StructuredPrompt)
@@ -63,3 +62,22 @@ When you are answering a question, you should try focus on using best practices
 
     promptdown_string = prompt.to_promptdown_string()
     assert promptdown_string == expected_promptdown_string
+
+
+@pytest.mark.parametrize("trailing_newlines", ["\n", "\n\n", "\n\n\n"])
+def test_empty_conversation_section_from_promptdown_string(trailing_newlines):
+    promptdown_string = (
+        """
+# Example Prompt
+
+## System Message
+
+You are a helpful assistant.
+
+## Conversation"""
+        + trailing_newlines
+    )
+
+    prompt = StructuredPrompt.from_promptdown_string(promptdown_string)
+    assert prompt.system_message == "You are a helpful assistant."
+    assert prompt.conversation is None
@@ -1,5 +1,6 @@
+from enum import Enum
 import pytest
-from promptdown import Message
+from promptdown import Message, StructuredPrompt
 
 
 def test_disallow_system_role_in_messages():
@@ -21,3 +22,30 @@ def test_valid_role_in_messages():
         _ = Message(role="Assistant", content="This is also fine.")
     except ValueError:
         pytest.fail("Unexpected ValueError for valid roles.")
+
+
+def test_str_enum_roles_in_messages():
+    class Role(str, Enum):
+        USER = "user"
+        ASSISTANT = "Assistant"
+        SYSTEM = "system"
+
+    # A str-based enum is accepted as a role, whether or not its value is already lowercase,
+    # and compares and converts like the plain string
+    message = Message(role=Role.USER, content="This is fine.")
+    assert message == Message(role="User", content="This is fine.")
+    reply = Message(role=Role.ASSISTANT, content="This is also fine.")
+    assert reply == Message(role="assistant", content="This is also fine.")
+
+    prompt = StructuredPrompt(
+        name="Example Prompt",
+        system_message="You are a helpful assistant.",
+        conversation=[message, reply],
+    )
+    assert [
+        chat_message["role"]
+        for chat_message in prompt.to_chat_completion_messages(content_parts=False)
+    ] == ["system", "user", "assistant"]
+
+    with pytest.raises(ValueError):
+        _ = Message(role=Role.SYSTEM, content="This should not be allowed.")
@@ -1,30 +1,13 @@
+from dataclasses import asdict
 from promptdown import StructuredPrompt, Message
+from tests._fixtures import EXAMPLE_CONVERSATION, EXAMPLE_CONVERSATION_WITH_NAMES, build_conversation
 
 
 def test_to_chat_completion_messages_without_names():
     prompt = StructuredPrompt(
         name="Example Prompt",
         system_message="You are a helpful assistant.\n\nYou should try to provide clear and concise answers to the user's questions.",
-        conversation=[
-            Message(role="User", content="Hi, can you help me?"),
-            Message(
-                role="Assistant", content="Of course! What do you need assistance with?"
-            ),
-            Message(role="User", content="I'm having trouble with my code."),
-            Message(
-                role="Assistant",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                content="That error usually occurs when you try to use a variable that hasn't been declared "
-                + "or assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
+        conversation=build_conversation(EXAMPLE_CONVERSATION),
     )
 
     expected_messages = [
@@ -83,32 +66,7 @@ def test_to_chat_completion_messages_with_names():
     prompt = StructuredPrompt(
         name="Example Prompt",
         system_message="You are a helpful assistant.",
-        conversation=[
-            Message(role="User", name="Alice", content="Hi, can you help me?"),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="Of course! What do you need assistance with?",
-            ),
-            Message(
-                role="User", name="Alice", content="I'm having trouble with my code."
-            ),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                name="Alice",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="That error usually occurs when you try to use a variable that hasn't been declared or assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
+        conversation=build_conversation(EXAMPLE_CONVERSATION_WITH_NAMES),
     )
 
     expected_messages = [
@@ -174,3 +132,53 @@ def test_to_chat_completion_messages_with_names():
 
     messages = prompt.to_chat_completion_messages()
     assert messages == expected_messages
+
+
+def test_to_chat_completion_messages_after_role_change():
+    """Test that reassigning a message's role is reflected in comparisons and in the output."""
+    message = Message(role="User", content="Hi, can you help me?")
+    message.role = "Assistant"
+    assert message == Message(role="Assistant", content="Hi, can you help me?")
+    assert asdict(message) == {
+        "role": "Assistant",
+        "content": "Hi, can you help me?",
+        "name": None,
+    }
+
+    prompt = StructuredPrompt(
+        name="Example Prompt",
+        system_message="You are a helpful assistant.",
+        conversation=[message],
+    )
+    assert prompt.to_chat_completion_messages() == [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {
+            "role": "assistant",
+            "content": [{"type": "text", "text": "Hi, can you help me?"}],
+        },
+    ]
+
+
+def test_to_chat_completion_messages_without_content_parts():
+    prompt = StructuredPrompt(
+        name="Example Prompt",
+        system_message="You are a helpful assistant.",
+        conversation=[
+            Message(role="User", name="Alice", content="Hi, can you help me?"),
+            Message(
+                role="Assistant", content="Of course! What do you need assistance with?"
+            ),
+        ],
+    )
+
+    expected_messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Hi, can you help me?", "name": "Alice"},
+        {
+            "role": "assistant",
+            "content": "Of course! What do you need assistance with?",
+        },
+    ]
+
+    messages = prompt.to_chat_completion_messages(content_parts=False)
+    assert messages == expected_messages
@@ -1,30 +1,12 @@
-from promptdown import StructuredPrompt, Message
+from promptdown import StructuredPrompt
+from tests._fixtures import EXAMPLE_CONVERSATION, EXAMPLE_CONVERSATION_WITH_NAMES, build_conversation
 
 
 def test_to_promptdown_string_without_names():
     prompt = StructuredPrompt(
         name="Example Prompt",
         system_message="You are a helpful assistant.",
-        conversation=[
-            Message(role="User", content="Hi, can you help me?"),
-            Message(
-                role="Assistant", content="Of course! What do you need assistance with?"
-            ),
-            Message(role="User", content="I'm having trouble with my code."),
-            Message(
-                role="Assistant",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                content="That error usually occurs when you try to use a variable that hasn't been declared "
-                + "or assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
+        conversation=build_conversation(EXAMPLE_CONVERSATION),
     )
 
     expected_promptdown_string = """# Example Prompt
@@ -51,32 +33,7 @@ def test_to_promptdown_string_with_names():
     prompt = StructuredPrompt(
         name="Example Prompt",
         system_message="You are a helpful assistant.",
-        conversation=[
-            Message(role="User", name="Alice", content="Hi, can you help me?"),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="Of course! What do you need assistance with?",
-            ),
-            Message(
-                role="User", name="Alice", content="I'm having trouble with my code."
-            ),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="I'd be happy to help. What seems to be the problem?",
-            ),
-            Message(
-                role="User",
-                name="Alice",
-                content='I\'m getting an error message that says "undefined variable".',
-            ),
-            Message(
-                role="Assistant",
-                name="Bot",
-                content="That error usually occurs when you try to use a variable that hasn't been declared or assigned a value. Can you show me the code where you're encountering this error?",
-            ),
-        ],
+        conversation=build_conversation(EXAMPLE_CONVERSATION_WITH_NAMES),
     )
 
     expected_promptdown_string = """# Example Prompt